@@ -1,5 +1,6 @@
 """Constants for the Hong Kong Observatory integration."""
 
+from datetime import timedelta, timezone
 from typing import Final
 
 DOMAIN:Final = "hk_observatory"
@@ -8,6 +9,9 @@ ATTRIBUTION: Final = "Data provided by Hong Kong Observatory"
 CONF_CLIMATE_STATION_ID: Final = "climate_station_id"
 CONF_FORECAST_STATION_ID: Final = "forecast_station_id"
 
+# HKO publishes all timestamps in Hong Kong Time (UTC+8, no DST)
+HK_TZ: Final = timezone(timedelta(hours=8))
+
 ATTR_AWS_LAST_UPDATED = "_aws_last_updated"
 ATTR_FORECAST_LAST_UPDATED = "_forecast_last_updated"
 
@@ -17,6 +21,9 @@ ATTR_DAILY_FORECAST = "_daily_forecast"
 ATTR_OTHER = "_other"
 ATTR_WARNINGS = "_warn"
 
+# Derived numeric tropical cyclone signal level, stored alongside the warnings
+WARNING_TC_LEVEL = "tclevel"
+
 # https://www.hko.gov.hk/textonly/v2/explain/wxicon_e.htm
 MAP_CONDITION = {
     50: "sunny",
@@ -56,4 +63,9 @@ MAP_CONDITION = {
     85: "fog",
 }
 
-
+# HKO returns icon codes as ints in some feeds and as strings in others, so
+# this map accepts either form with a single lookup and no int() parse.
+MAP_CONDITION_RAW: Final = {
+    **MAP_CONDITION,
+    **{str(code): condition for code, condition in MAP_CONDITION.items()},
+}
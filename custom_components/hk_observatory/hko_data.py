@@ -1,18 +1,30 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
+from functools import lru_cache
+import io
 import logging
+import re
 from typing import Any
+from collections.abc import Callable
 
-import csv
-
-from aiohttp import ClientSession
-from aiohttp.client_exceptions import ClientConnectorError
-from async_timeout import timeout
+from aiohttp import ClientError, ClientSession, ClientTimeout
 
+from homeassistant.components.weather import (
+    ATTR_FORECAST_CONDITION,
+    ATTR_FORECAST_NATIVE_TEMP,
+    ATTR_FORECAST_NATIVE_TEMP_LOW,
+    ATTR_FORECAST_TIME,
+    ATTR_FORECAST_WIND_BEARING,
+    ATTR_FORECAST_WIND_SPEED,
+    ATTR_FORECAST_PRECIPITATION_PROBABILITY,
+    Forecast,
+)
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.core import HomeAssistant
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
   ATTR_AWS,
@@ -21,13 +33,183 @@ from .const import (
   ATTR_OTHER,
   ATTR_WARNINGS,
   DOMAIN,
+  HK_TZ,
+  MAP_CONDITION,
+  MAP_CONDITION_RAW,
   ATTR_AWS_LAST_UPDATED,
   ATTR_FORECAST_LAST_UPDATED,
+  WARNING_TC_LEVEL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=60)
+UPDATE_TIMEOUT = 10
+# Number of consecutive transient failures served from the last good data
+# before the entities are marked unavailable
+MAX_CONSECUTIVE_FAILURES = 3
+REQUEST_TIMEOUT = ClientTimeout(total=8)
+
+_TC_RE = re.compile(r"TC(\d+)")
+
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        (
+            "January", "February", "March", "April", "May", "June",
+            "July", "August", "September", "October", "November", "December",
+        ),
+        start=1,
+    )
+}
+
+
+def _parse_aws_time(line: str) -> datetime:
+    """Parse "Latest readings recorded at HH:MM Hong Kong Time DD Month YYYY"."""
+    fields = line.split(" at ", 1)[1].split()
+    hour, minute = fields[0].split(":")
+    day, month, year = fields[-3:]
+    return datetime(int(year), _MONTHS[month], int(day), int(hour), int(minute), tzinfo=HK_TZ)
+
+
+def _parse_forecast_time(value: str) -> datetime:
+    """Parse a YYYYMMDDHHMMSS timestamp in Hong Kong time."""
+    return datetime(
+        int(value[0:4]), int(value[4:6]), int(value[6:8]),
+        int(value[8:10]), int(value[10:12]), int(value[12:14]),
+        tzinfo=HK_TZ,
+    )
+
+
+# HKO repeats the same forecast hours/dates across refreshes, so the
+# ISO strings are memoised rather than re-parsed on every refresh.
+# Cache misses go through the C fromisoformat parser with a fixed +08:00
+# (Hong Kong Time) offset, which also validates the fields.
+@lru_cache(maxsize=256)
+def _iso_hour(value: str) -> str:
+    """Return the ISO 8601 string for a YYYYMMDDHH forecast hour."""
+    return datetime.fromisoformat(f"{value[0:4]}-{value[4:6]}-{value[6:8]}T{value[8:10]}:00:00+08:00").isoformat()
+
+
+@lru_cache(maxsize=256)
+def _iso_day(value: str) -> str:
+    """Return the ISO 8601 string for a YYYYMMDD forecast date."""
+    return datetime.fromisoformat(f"{value[0:4]}-{value[4:6]}-{value[6:8]}T00:00:00+08:00").isoformat()
+
+
+# HKO reports chance of rain as "x%" or "< x%"; the common values are
+# tabulated so the happy path is a single lookup.
+_CHANCE_OF_RAIN: dict[str, int] = {
+    **{f"{percent}%": percent for percent in range(0, 101)},
+    **{f"< {percent}%": percent // 2 for percent in range(10, 101, 10)},
+}
+
+
+def parse_chance_of_rain(chance: str) -> int | None:
+    """Parse chance of rain."""
+    percent = _CHANCE_OF_RAIN.get(chance)
+    if percent is not None:
+        return percent
+    return _parse_chance_of_rain_slow(chance)
+
+
+def _parse_chance_of_rain_slow(chance: str) -> int | None:
+    """Parse a chance of rain string that is not in the lookup table."""
+    try:
+        # it can be "x%" or "< x%"; report the midpoint of "< x%"
+        chance = chance.strip()
+        if chance.startswith("<"):
+            return int(chance[1:].strip().rstrip("%").strip()) // 2
+        return int(chance.rstrip("%").strip())
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _to_float(value: Any) -> float | None:
+    """Convert an optional forecast number, returning None if it is missing or malformed."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value: Any) -> int | None:
+    """Convert an optional forecast integer, returning None if it is missing or malformed."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_condition(code: Any) -> str | None:
+    """Map an HKO weather icon code to a Home Assistant condition."""
+    condition = MAP_CONDITION_RAW.get(code)
+    if condition is None and code is not None:
+        # Non-canonical spellings such as "050" or " 50" miss the exact lookup
+        try:
+            condition = MAP_CONDITION.get(int(code))
+        except (TypeError, ValueError):
+            pass
+    return condition
+
+
+def _build_hourly_forecast(entry: dict[str, Any]) -> Forecast:
+    """Convert one HKO hourly forecast entry."""
+    get = entry.get
+    return {
+        ATTR_FORECAST_TIME: _iso_hour(entry["ForecastHour"]),
+        ATTR_FORECAST_NATIVE_TEMP: _to_float(get("ForecastTemperature")),
+        ATTR_FORECAST_NATIVE_TEMP_LOW: _to_float(get("ForecastMinimumTemperature")),
+        ATTR_FORECAST_WIND_BEARING: _to_int(get("ForecastWindDirection")),
+        ATTR_FORECAST_WIND_SPEED: _to_float(get("ForecastWindSpeed")),
+        ATTR_FORECAST_CONDITION: parse_condition(get("ForecastWeather")),
+    }
+
+
+def _build_daily_forecast(entry: dict[str, Any]) -> Forecast:
+    """Convert one HKO daily forecast entry."""
+    get = entry.get
+    return {
+        ATTR_FORECAST_TIME: _iso_day(entry["ForecastDate"]),
+        ATTR_FORECAST_NATIVE_TEMP: _to_float(get("ForecastMaximumTemperature")),
+        ATTR_FORECAST_NATIVE_TEMP_LOW: _to_float(get("ForecastMinimumTemperature")),
+        ATTR_FORECAST_PRECIPITATION_PROBABILITY: parse_chance_of_rain(v) if (v := get("ForecastChanceOfRain")) is not None else None,
+        ATTR_FORECAST_CONDITION: parse_condition(get("ForecastDailyWeather")),
+    }
+
+
+def _build_forecasts(
+    entries: list[dict[str, Any]], build: Callable[[dict[str, Any]], Forecast], required: str
+) -> list[Forecast]:
+    """Convert the HKO forecast entries that carry the required key.
+
+    Malformed optional fields are already reported as None by the builders;
+    an entry whose time is missing or malformed is skipped rather than raised,
+    so bad forecast data cannot fail the refresh for the station and warning data.
+    """
+    forecasts = []
+    for entry in entries:
+        if required not in entry:
+            continue
+        try:
+            forecasts.append(build(entry))
+        except (KeyError, TypeError, ValueError) as error:
+            _LOGGER.debug("Skipping malformed HKO forecast entry %s: %s", entry, error)
+    return forecasts
+
+
+def _parse_tc_level(warnings: dict[str, Any]) -> int:
+    """Return the numeric tropical cyclone signal level, or 0 if none is hoisted."""
+    signal = warnings.get("WTCSGNL")
+    if signal is None:
+        return 0
+    # A malformed signal only zeroes the level rather than failing the refresh
+    match = _TC_RE.match(signal.get("subtype") or "")
+    return int(match.group(1)) if match else 0
 
 
 class HKODataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -46,67 +228,100 @@ class HKODataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.session = session
         self.climate_station_id = climate_station_id
         self.forecast_station_id = forecast_station_id
+        self._last_good_data: dict[str, Any] | None = None
+        self._consecutive_failures = 0
 
         update_interval = MIN_TIME_BETWEEN_UPDATES
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=update_interval)
+        # Only notify entities when the fetched data differs from the last refresh;
+        # the base class already stops polling while no listeners are subscribed.
+        super().__init__(
+            hass, _LOGGER, name=DOMAIN, update_interval=update_interval, always_update=False
+        )
 
     async def _async_get_station_data(self) -> dict[str, Any]:
         """Get automatic weather station (AWS) observations."""
-        resp = await self.session.get("https://www.hko.gov.hk/wxinfo/awsgis/latestReadings_AWS1_v2.txt")
+        resp = await self.session.get("https://www.hko.gov.hk/wxinfo/awsgis/latestReadings_AWS1_v2.txt", timeout=REQUEST_TIMEOUT)
         rawdata = await resp.text()
-        firstline, datalines = rawdata.split('\n', 1)
-        datareader = csv.DictReader(datalines.split('\n'))
-        rawdata = dict([(x['STN'], x) for x in datareader])
-        data = rawdata[self.climate_station_id]
-        data[ATTR_AWS_LAST_UPDATED] = dt_util.as_utc(
-            datetime.strptime(
-                str(firstline) + " +0800", "Latest readings recorded at %H:%M Hong Kong Time %d %B %Y %z"
-            )
-        )
+        # Read the body line by line in a single pass; newline=None also
+        # folds any \r\n line endings so the fields compare cleanly.
+        stream = io.StringIO(rawdata, newline=None)
+        firstline = stream.readline().rstrip('\n')
+        header = stream.readline().rstrip('\n').split(',')
+        stn_idx = header.index('STN')
+        # Only the configured station is needed, so stop at the first match
+        # instead of building a dict for every station in the file. The file
+        # is plain comma-separated text with no quoting, so str.split suffices.
+        for line in stream:
+            fields = line.rstrip('\n').split(',')
+            if len(fields) > stn_idx and fields[stn_idx] == self.climate_station_id:
+                data = dict(zip(header, fields))
+                break
+        else:
+            raise UpdateFailed(f"Station {self.climate_station_id} not found in AWS readings")
+        data[ATTR_AWS_LAST_UPDATED] = dt_util.as_utc(_parse_aws_time(firstline))
         return data
 
-    async def _async_get_forecast_data(self) -> list[dict[str, Any]]:
+    async def _async_get_forecast_data(self) -> dict[str, Any]:
         """Get forecast data."""
         url = f"https://maps.weather.gov.hk/ocf/dat/{self.forecast_station_id}.xml"
-        resp = await self.session.get(url)
-        rawdata = await resp.json(content_type=None)
+        resp = await self.session.get(url, timeout=REQUEST_TIMEOUT)
+        rawdata = json_loads(await resp.read())
         data = {
-            "hourly": rawdata["HourlyWeatherForecast"],
-            "daily": rawdata["DailyForecast"],
-            "last_modified": dt_util.as_utc(
-                datetime.strptime(
-                    str(rawdata["LastModified"]) + " +0800", "%Y%m%d%H%M%S %z"
-                )
-            ),
+            # Built once per refresh so the weather entity can hand the lists
+            # straight to every forecast subscriber.
+            "hourly": _build_forecasts(rawdata["HourlyWeatherForecast"], _build_hourly_forecast, "ForecastWeather"),
+            "daily": _build_forecasts(rawdata["DailyForecast"], _build_daily_forecast, "ForecastDailyWeather"),
+            "last_modified": dt_util.as_utc(_parse_forecast_time(str(rawdata["LastModified"]))),
         }
         return data
 
     async def _async_get_other_data(self) -> dict[str, Any]:
-        resp = await self.session.get("https://data.weather.gov.hk/weatherAPI/opendata/weather.php?dataType=rhrread&lang=en")
-        data = await resp.json()
+        resp = await self.session.get("https://data.weather.gov.hk/weatherAPI/opendata/weather.php?dataType=rhrread&lang=en", timeout=REQUEST_TIMEOUT)
+        data = json_loads(await resp.read())
         return data
 
     async def _async_get_warnings(self) -> dict[str, Any]:
         """Get warnings."""
         # We use warningInfo instead of warnsum because warnsum does not have pre-T8 signal
-        resp = await self.session.get("https://data.weather.gov.hk/weatherAPI/opendata/weather.php?dataType=warningInfo&lang=en")
-        rawdata = await resp.json()
-        try:
-            return dict([(i['warningStatementCode'], i) for i in rawdata['details']])
-        except KeyError:
+        resp = await self.session.get("https://data.weather.gov.hk/weatherAPI/opendata/weather.php?dataType=warningInfo&lang=en", timeout=REQUEST_TIMEOUT)
+        body = await resp.read()
+        # The body is empty, or has no details, when no warnings are in force
+        if not body.strip():
+            return {}
+        rawdata = json_loads(body)
+        details = rawdata.get('details') if rawdata else None
+        if not details:
             return {}
+        return {i['warningStatementCode']: i for i in details}
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data."""
         try:
-            async with timeout(10):
-                aws = await self._async_get_station_data()
-                forecast = await self._async_get_forecast_data()
-                other = await self._async_get_other_data()
-                warnings = await self._async_get_warnings()
-        except ClientConnectorError as error:
-            raise UpdateFailed(error) from error
-        return {
+            async with asyncio.timeout(UPDATE_TIMEOUT):
+                aws, forecast, other, warnings = await asyncio.gather(
+                    self._async_get_station_data(),
+                    self._async_get_forecast_data(),
+                    self._async_get_other_data(),
+                    self._async_get_warnings(),
+                )
+        except (ClientError, TimeoutError) as error:
+            # Connection errors, bad HTTP responses and request timeouts are
+            # all treated as transient and may be served from the last good data
+            self._consecutive_failures += 1
+            if self._last_good_data is not None and self._consecutive_failures < MAX_CONSECUTIVE_FAILURES:
+                _LOGGER.debug(
+                    "Error fetching HKO data (attempt %d), keeping last known data: %s",
+                    self._consecutive_failures,
+                    error,
+                )
+                return self._last_good_data
+            raise UpdateFailed(f"Error communicating with HKO: {error!r}") from error
+        except ValueError as error:
+            raise UpdateFailed(f"Invalid response from HKO: {error}") from error
+        # Derive the signal level once per refresh so each sensor is a plain lookup
+        warnings[WARNING_TC_LEVEL] = _parse_tc_level(warnings)
+        self._consecutive_failures = 0
+        self._last_good_data = {
             ATTR_AWS: aws,
             ATTR_FORECAST: forecast["hourly"],
             ATTR_DAILY_FORECAST: forecast["daily"],
@@ -114,3 +329,4 @@ class HKODataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ATTR_OTHER: other,
             ATTR_WARNINGS: warnings,
         }
+        return self._last_good_data
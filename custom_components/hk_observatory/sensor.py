@@ -1,8 +1,9 @@
 """Sensors for HKO."""
 from __future__ import annotations
 
+from abc import abstractmethod
 from dataclasses import dataclass
-import re
+from itertools import chain
 from typing import Any, cast
 from collections.abc import Mapping
 
@@ -40,6 +41,7 @@ from .const import (
     ATTR_WARNINGS,
     ATTRIBUTION,
     DOMAIN,
+    WARNING_TC_LEVEL,
 )
 
 PARALLEL_UPDATES = 1
@@ -98,7 +100,7 @@ WARNING_SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
         icon="mdi:weather-hurricane",
     ),
     SensorEntityDescription(
-        key="tclevel",
+        key=WARNING_TC_LEVEL,
         name="Tropical Cyclone Warning Level",
         icon="mdi:weather-hurricane",
     ),
@@ -165,27 +167,69 @@ BINARY_WARNING_SENSOR_TYPES: tuple[BinarySensorEntityDescription, ...] = (
     ),
 )
 
+# (unique_id, entity_id) for each warning sensor, keyed by description key
+_WARNING_IDS: dict[str, tuple[str, str]] = {
+    description.key: (f"hko_warning_{description.key}", ENTITY_ID_FORMAT.format(f"hko_warning_{description.key}"))
+    for description in WARNING_SENSOR_TYPES
+}
+_BINARY_WARNING_IDS: dict[str, tuple[str, str]] = {
+    description.key: (
+        f"hko_warning_{description.key}",
+        BINARY_SENSOR_ENTITY_ID_FORMAT.format(f"hko_warning_{description.key}"),
+    )
+    for description in BINARY_WARNING_SENSOR_TYPES
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Add HKO entities from a config_entry."""
     coordinator: HKODataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    sensors = [HKOWeatherSensor(coordinator, description) for description in SENSOR_TYPES]
-    sensors.extend(HKOWarningSensor(coordinator, description) for description in WARNING_SENSOR_TYPES)
-    sensors.extend(HKOBinaryWarningSensor(coordinator, description) for description in BINARY_WARNING_SENSOR_TYPES)
-    async_add_entities(sensors)
+    async_add_entities(
+        chain(
+            (HKOWeatherSensor(coordinator, description) for description in SENSOR_TYPES),
+            (HKOWarningSensor(coordinator, description) for description in WARNING_SENSOR_TYPES),
+            (HKOBinaryWarningSensor(coordinator, description) for description in BINARY_WARNING_SENSOR_TYPES),
+        )
+    )
+
+
+class HKOCoordinatorEntity(CoordinatorEntity[HKODataUpdateCoordinator]):
+    """Base for HKO sensors that only write state when their data or availability changes."""
+
+    def __init__(self, coordinator: HKODataUpdateCoordinator, description: EntityDescription) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._set_sensor_data(self._read_sensor_data())
+        self._last_available = True
 
+    @abstractmethod
+    def _read_sensor_data(self) -> Any:
+        """Return this sensor's value from the coordinator data."""
 
-class HKOWeatherSensor(CoordinatorEntity[HKODataUpdateCoordinator], SensorEntity):
+    def _set_sensor_data(self, sensor_data: Any) -> None:
+        self._sensor_data = sensor_data
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        sensor_data = self._read_sensor_data()
+        # Availability follows the coordinator, so a failed or recovered
+        # refresh must still be written even if the data is unchanged.
+        if sensor_data == self._sensor_data and self.available == self._last_available:
+            return
+        self._set_sensor_data(sensor_data)
+        self._last_available = self.available
+        self.async_write_ha_state()
+
+
+class HKOWeatherSensor(HKOCoordinatorEntity, SensorEntity):
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = True
     entity_description: SensorEntityDescription
 
     def __init__(self, coordinator: HKODataUpdateCoordinator, description: SensorEntityDescription) -> None:
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._sensor_data = coordinator.data[ATTR_AWS][description.key]
+        super().__init__(coordinator, description)
         self._attr_name = description.name
         self._attr_unique_id = f"hko_{coordinator.climate_station_id}_{description.key}"
         self._attr_device_info = get_device_info(coordinator.name, coordinator.climate_station_id, coordinator.forecast_station_id)
@@ -195,90 +239,70 @@ class HKOWeatherSensor(CoordinatorEntity[HKODataUpdateCoordinator], SensorEntity
     def native_value(self) -> Any:
         return float(self._sensor_data)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._sensor_data = self.coordinator.data[ATTR_AWS][self.entity_description.key]
-        self.async_write_ha_state()
+    def _read_sensor_data(self) -> Any:
+        return self.coordinator.data[ATTR_AWS][self.entity_description.key]
 
 
-class HKOWarningSensor(CoordinatorEntity[HKODataUpdateCoordinator], SensorEntity):
+class HKOWarningSensor(HKOCoordinatorEntity, SensorEntity):
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = True
     entity_description: SensorEntityDescription
 
     def __init__(self, coordinator: HKODataUpdateCoordinator, description: SensorEntityDescription) -> None:
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._sensor_data = _parse_warning(description, coordinator.data[ATTR_WARNINGS])
-        self._attrs: dict[str, Any] = {}
+        super().__init__(coordinator, description)
         self._attr_name = description.name
-        self._attr_unique_id = f"hko_warning_{description.key}"
+        self._attr_unique_id, self.entity_id = _WARNING_IDS[description.key]
         self._attr_device_info = get_device_info(coordinator.name, coordinator.climate_station_id, coordinator.forecast_station_id)
-        self.entity_id = ENTITY_ID_FORMAT.format(f"hko_warning_{description.key}")
 
     @property
     def native_value(self) -> Any:
         if self._sensor_data is None:
             return None
         if isinstance(self._sensor_data, Mapping):
-            if "subtype" in self._sensor_data:
-                return self._sensor_data["subtype"]
-            return "Active"
+            return self._sensor_data.get("subtype", "Active")
         return self._sensor_data
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._sensor_data = _parse_warning(self.entity_description, self.coordinator.data[ATTR_WARNINGS])
-        self.async_write_ha_state()
+    def _read_sensor_data(self) -> Any:
+        return self.coordinator.data[ATTR_WARNINGS].get(self.entity_description.key)
+
+    def _set_sensor_data(self, sensor_data: Any) -> None:
+        super()._set_sensor_data(sensor_data)
+        self._attrs = _warning_attributes(sensor_data)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        if self._sensor_data is not None and isinstance(self._sensor_data, Mapping):
-            if "contents" in self._sensor_data:
-                self._attrs["contents"] = '\n\n'.join(self._sensor_data['contents'])
         return self._attrs
 
 
-class HKOBinaryWarningSensor(CoordinatorEntity[HKODataUpdateCoordinator], BinarySensorEntity):
+class HKOBinaryWarningSensor(HKOCoordinatorEntity, BinarySensorEntity):
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = True
     entity_description: BinarySensorEntityDescription
 
     def __init__(self, coordinator: HKODataUpdateCoordinator, description: BinarySensorEntityDescription) -> None:
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._sensor_data = _parse_warning(description, coordinator.data[ATTR_WARNINGS])
-        self._attrs: dict[str, Any] = {}
+        super().__init__(coordinator, description)
         self._attr_name = description.name
-        self._attr_unique_id = f"hko_warning_{description.key}"
+        self._attr_unique_id, self.entity_id = _BINARY_WARNING_IDS[description.key]
         self._attr_device_info = get_device_info(coordinator.name, coordinator.climate_station_id, coordinator.forecast_station_id)
-        self.entity_id = BINARY_SENSOR_ENTITY_ID_FORMAT.format(f"hko_warning_{description.key}")
 
     @property
     def is_on(self) -> bool:
         return self._sensor_data is not None
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._sensor_data = _parse_warning(self.entity_description, self.coordinator.data[ATTR_WARNINGS])
-        self.async_write_ha_state()
+    def _read_sensor_data(self) -> Any:
+        return self.coordinator.data[ATTR_WARNINGS].get(self.entity_description.key)
+
+    def _set_sensor_data(self, sensor_data: Any) -> None:
+        super()._set_sensor_data(sensor_data)
+        self._attrs = _warning_attributes(sensor_data)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        if self._sensor_data is not None and isinstance(self._sensor_data, Mapping):
-            if "contents" in self._sensor_data:
-                self._attrs["contents"] = '\n\n'.join(self._sensor_data['contents'])
         return self._attrs
 
 
-def _parse_warning(description: EntityDescription, data: dict[str, Any]) -> Any:
-    if description.key == "tclevel":
-        if "WTCSGNL" in data:
-            subtype = data["WTCSGNL"]["subtype"]
-            if subtype.startswith("TC"):
-                return int(re.compile("TC(\d+)").match(subtype).group(1))
-        return int(0)
-    try:
-        return data[description.key]
-    except KeyError:
-        return None
+def _warning_attributes(sensor_data: Any) -> dict[str, Any]:
+    """Return the state attributes for warning data, joining the contents once per update."""
+    if isinstance(sensor_data, Mapping) and (contents := sensor_data.get("contents")) is not None:
+        return {"contents": '\n\n'.join(contents)}
+    return {}
@@ -1,16 +1,7 @@
 """Support for Hong Kong Observatory weather service."""
-import logging
-from datetime import datetime
 import typing
 
 from homeassistant.components.weather import (
-    ATTR_FORECAST_CONDITION,
-    ATTR_FORECAST_NATIVE_TEMP,
-    ATTR_FORECAST_NATIVE_TEMP_LOW,
-    ATTR_FORECAST_TIME,
-    ATTR_FORECAST_WIND_BEARING,
-    ATTR_FORECAST_WIND_SPEED,
-    ATTR_FORECAST_PRECIPITATION_PROBABILITY,
     Forecast,
     WeatherEntity,
     WeatherEntityFeature,
@@ -23,12 +14,12 @@ from homeassistant.const import (
     SPEED_KILOMETERS_PER_HOUR,
     TEMP_CELSIUS,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import get_device_info
-from .hko_data import HKODataUpdateCoordinator
+from .hko_data import HKODataUpdateCoordinator, parse_condition
 from .const import (
     ATTR_AWS,
     ATTR_FORECAST,
@@ -36,7 +27,6 @@ from .const import (
     ATTR_OTHER,
     ATTRIBUTION,
     DOMAIN,
-    MAP_CONDITION,
 )
 
 PARALLEL_UPDATES = 1
@@ -54,117 +44,78 @@ class HKOWeatherEntity(CoordinatorEntity[HKODataUpdateCoordinator], WeatherEntit
     """Representation of a weather condition."""
 
     _attr_has_entity_name = True
+    _attr_name = None
+    _attr_attribution = ATTRIBUTION
+    _attr_native_precipitation_unit = LENGTH_MILLIMETERS
+    _attr_native_pressure_unit = PRESSURE_HPA
+    _attr_native_temperature_unit = TEMP_CELSIUS
+    _attr_native_visibility_unit = LENGTH_KILOMETERS
+    _attr_native_wind_speed_unit = SPEED_KILOMETERS_PER_HOUR
+    _attr_supported_features = WeatherEntityFeature.FORECAST_HOURLY | WeatherEntityFeature.FORECAST_DAILY
 
     def __init__(self, coordinator: HKODataUpdateCoordinator) -> None:
         """Initialise the platform with a data instance."""
         super().__init__(coordinator)
-        self._attr_name = None
         self._attr_device_info = get_device_info("Forecast", coordinator.climate_station_id, coordinator.forecast_station_id)
         self._attr_unique_id = f"hko_weather_{coordinator.climate_station_id}-{coordinator.forecast_station_id}"
-        self._attr_attribution = ATTRIBUTION
-        self._attr_native_precipitation_unit = LENGTH_MILLIMETERS
-        self._attr_native_pressure_unit = PRESSURE_HPA
-        self._attr_native_temperature_unit = TEMP_CELSIUS
-        self._attr_native_visibility_unit = LENGTH_KILOMETERS
-        self._attr_native_wind_speed_unit = SPEED_KILOMETERS_PER_HOUR
 
     @property
-    def supported_features(self) -> WeatherEntityFeature:
-        features = WeatherEntityFeature.FORECAST_HOURLY | WeatherEntityFeature.FORECAST_DAILY
-        return features
+    def _aws(self) -> dict[str, typing.Any]:
+        """Return the latest automatic weather station readings."""
+        return self.coordinator.data.get(ATTR_AWS) or {}
+
+    @property
+    def _other(self) -> dict[str, typing.Any]:
+        """Return the latest current weather report."""
+        return self.coordinator.data.get(ATTR_OTHER) or {}
 
     @property
     def condition(self) -> typing.Union[str, None]:
         """Return the current condition."""
+        icons = self._other.get("icon")
+        if not icons:
+            return None
+        return parse_condition(icons[0])
+
+    def _reading(self, key: str, convert: typing.Callable[[str], typing.Any] = float) -> typing.Any:
+        """Return a station reading converted to a number, or None if missing or malformed."""
+        value = self._aws.get(key)
+        if value is None:
+            return None
         try:
-            icon = self.coordinator.data[ATTR_OTHER]["icon"][0]
-            return MAP_CONDITION.get(int(icon))
-        except (KeyError, TypeError, ValueError):
+            return convert(value)
+        except ValueError:
             return None
 
     @property
     def native_temperature(self):
-        try:
-            return float(self.coordinator.data[ATTR_AWS]["TEMP"])
-        except (KeyError, TypeError, ValueError):
-            return None
+        return self._reading("TEMP")
 
     @property
     def native_pressure(self):
-        try:
-            return float(self.coordinator.data[ATTR_AWS]["PRESSURE"])
-        except (KeyError, TypeError, ValueError):
-            return None
+        return self._reading("PRESSURE")
 
     @property
     def humidity(self):
-        try:
-            return float(self.coordinator.data[ATTR_AWS]["RH"])
-        except (KeyError, TypeError, ValueError):
-            return None
+        return self._reading("RH")
 
     @property
     def native_visibility(self):
-        try:
-            return float(self.coordinator.data[ATTR_AWS]["VISIBILITY"]) / 1000
-        except (KeyError, TypeError, ValueError):
-            return None
+        visibility = self._reading("VISIBILITY")
+        return visibility / 1000 if visibility is not None else None
 
     @property
     def native_wind_speed(self):
-        try:
-            return float(self.coordinator.data[ATTR_AWS]["WINDSPEED"])
-        except (KeyError, TypeError, ValueError):
-            return None
+        return self._reading("WINDSPEED")
 
     @property
     def wind_bearing(self):
-        try:
-            return int(self.coordinator.data[ATTR_AWS]["WINDDIRECTION"])
-        except (KeyError, TypeError, ValueError):
-            return None
+        return self._reading("WINDDIRECTION", int)
 
-    def _get_forecast(self) -> list[Forecast] | None:
-        data = [
-            {
-                ATTR_FORECAST_TIME: datetime.strptime(entry["ForecastHour"] + " +0800", "%Y%m%d%H %z").isoformat(),
-                ATTR_FORECAST_NATIVE_TEMP: float(entry["ForecastTemperature"]) if "ForecastTemperature" in entry else None,
-                ATTR_FORECAST_NATIVE_TEMP_LOW: float(entry["ForecastMinimumTemperature"]) if "ForecastMinimumTemperature" in entry else None,
-                ATTR_FORECAST_WIND_BEARING: int(entry["ForecastWindDirection"]) if "ForecastWindDirection" in entry else None,
-                ATTR_FORECAST_WIND_SPEED: float(entry["ForecastWindSpeed"]) if "ForecastWindSpeed" in entry else None,
-                ATTR_FORECAST_CONDITION: MAP_CONDITION.get(int(entry["ForecastWeather"])) if "ForecastWeather" in entry else None,
-            }
-            for entry in self.coordinator.data[ATTR_FORECAST] if "ForecastWeather" in entry
-        ]
-        return data
-
-    @callback
     async def async_forecast_hourly(self) -> list[Forecast] | None:
         """Return hourly forecast."""
-        return self._get_forecast()
+        return self.coordinator.data[ATTR_FORECAST]
 
-    @callback
     async def async_forecast_daily(self) -> list[Forecast] | None:
         """Return daily forecast."""
-        data = [
-            {
-                ATTR_FORECAST_TIME: datetime.strptime(entry["ForecastDate"] + " +0800", "%Y%m%d %z").isoformat(),
-                ATTR_FORECAST_NATIVE_TEMP: float(entry["ForecastMaximumTemperature"]) if "ForecastMaximumTemperature" in entry else None,
-                ATTR_FORECAST_NATIVE_TEMP_LOW: float(entry["ForecastMinimumTemperature"]) if "ForecastMinimumTemperature" in entry else None,
-                ATTR_FORECAST_PRECIPITATION_PROBABILITY: parse_chance_of_rain(entry["ForecastChanceOfRain"]) if "ForecastChanceOfRain" in entry else None,
-                ATTR_FORECAST_CONDITION: MAP_CONDITION.get(int(entry["ForecastDailyWeather"])) if "ForecastDailyWeather" in entry else None,
-            }
-            for entry in self.coordinator.data[ATTR_DAILY_FORECAST] if "ForecastDailyWeather" in entry
-        ]
-        return data
-
-def parse_chance_of_rain(chance: str) -> int | None:
-    """Parse chance of rain."""
-    try:
-        # it can be "x%" or "< 10%"
-        if chance.startswith("<"):
-            percent = int(chance[2:-1])
-            return percent / 2
-        return int(chance[:-1])
-    except (TypeError, ValueError):
-        return None
+        return self.coordinator.data[ATTR_DAILY_FORECAST]